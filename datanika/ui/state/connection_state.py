@@ -2,8 +2,10 @@
 
 import json
 import re
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from datanika.config import settings
 from datanika.models.connection import ConnectionDirection, ConnectionType
@@ -51,6 +53,66 @@ _DEFAULT_PORTS: dict[str, str] = {
 # Connection types that use the SQL database form group (host/port/user/pass/db/schema)
 _DB_TYPES = {"postgres", "mysql", "mssql", "redshift", "clickhouse"}
 
+# (config key, form attribute, coercion) — falsy form values are omitted from the config
+_ConfigField = tuple[str, str, Callable[[str], object] | None]
+
+_DB_CONFIG_FIELDS: tuple[_ConfigField, ...] = (
+    ("host", "form_host", None),
+    ("port", "form_port", int),
+    ("user", "form_user", None),
+    ("password", "form_password", None),
+    ("database", "form_database", None),
+    ("schema", "form_schema", None),
+)
+_FILE_CONFIG_FIELDS: tuple[_ConfigField, ...] = (
+    ("uploaded_file_id", "form_uploaded_file_id", None),
+    ("bucket_url", "form_bucket_url", None),
+)
+
+# Per connection type, the structured form fields that make up its config
+_CONFIG_FIELDS: dict[str, tuple[_ConfigField, ...]] = {
+    **dict.fromkeys(_DB_TYPES, _DB_CONFIG_FIELDS),
+    **dict.fromkeys(("csv", "json", "parquet"), _FILE_CONFIG_FIELDS),
+    "sqlite": (("path", "form_path", None),),
+    "bigquery": (
+        ("project", "form_project", None),
+        ("dataset", "form_dataset", None),
+        ("keyfile_json", "form_keyfile_json", None),
+    ),
+    "snowflake": (
+        ("account", "form_account", None),
+        ("user", "form_user", None),
+        ("password", "form_password", None),
+        ("database", "form_database", None),
+        ("warehouse", "form_warehouse", None),
+        ("role", "form_role", None),
+        ("schema", "form_schema", None),
+    ),
+    "s3": (
+        ("bucket_url", "form_bucket_url", None),
+        ("aws_access_key_id", "form_aws_access_key_id", None),
+        ("aws_secret_access_key", "form_aws_secret_access_key", None),
+        ("region_name", "form_region_name", None),
+        ("endpoint_url", "form_endpoint_url", None),
+    ),
+    "google_sheets": (
+        ("spreadsheet_url", "form_spreadsheet_url", None),
+        ("service_account_json", "form_service_account_json", None),
+    ),
+    "rest_api": (
+        ("base_url", "form_base_url", None),
+        ("api_key", "form_api_key", None),
+        ("extra_headers", "form_extra_headers", None),
+    ),
+    "mongodb": (
+        ("host", "form_host", None),
+        ("port", "form_port", int),
+        ("user", "form_user", None),
+        ("password", "form_password", None),
+        ("database", "form_database", None),
+    ),
+}
+
 
 def _validate_connection_form(
     name: str,
@@ -122,18 +184,24 @@ def _validate_connection_form(
     return ""
 
 
+# Direction per known connection type, derived once from the source/destination sets
+_DIRECTION_MAP: Mapping[str, ConnectionDirection] = MappingProxyType(
+    {
+        **dict.fromkeys(SOURCE_TYPES - DESTINATION_TYPES, ConnectionDirection.SOURCE),
+        **dict.fromkeys(DESTINATION_TYPES - SOURCE_TYPES, ConnectionDirection.DESTINATION),
+        **dict.fromkeys(SOURCE_TYPES & DESTINATION_TYPES, ConnectionDirection.BOTH),
+    }
+)
+
+
 def _infer_direction(connection_type: str) -> ConnectionDirection:
-    """Infer direction from connection type."""
-    is_source = connection_type in SOURCE_TYPES
-    is_dest = connection_type in DESTINATION_TYPES
-    if is_source and is_dest:
-        return ConnectionDirection.BOTH
-    if is_dest:
-        return ConnectionDirection.DESTINATION
-    return ConnectionDirection.SOURCE
+    """Infer direction from connection type; unknown types default to SOURCE."""
+    return _DIRECTION_MAP.get(connection_type, ConnectionDirection.SOURCE)
 
 
 class ConnectionItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int = 0
     name: str = ""
     connection_type: str = ""
@@ -156,7 +224,7 @@ class ConnectionState(BaseState):
 
     # SQL database fields (postgres, mysql, mssql, redshift)
     form_host: str = ""
-    form_port: str = "5432"
+    form_port: str = _DEFAULT_PORTS["postgres"]
     form_user: str = ""
     form_password: str = ""
     form_database: str = ""
@@ -326,94 +394,10 @@ class ConnectionState(BaseState):
             return json.loads(self.form_config)
 
         config: dict = {}
-        t = self.form_type
-
-        if t in _DB_TYPES:
-            if self.form_host:
-                config["host"] = self.form_host
-            if self.form_port:
-                config["port"] = int(self.form_port)
-            if self.form_user:
-                config["user"] = self.form_user
-            if self.form_password:
-                config["password"] = self.form_password
-            if self.form_database:
-                config["database"] = self.form_database
-            if self.form_schema:
-                config["schema"] = self.form_schema
-
-        elif t == "sqlite":
-            if self.form_path:
-                config["path"] = self.form_path
-
-        elif t == "bigquery":
-            if self.form_project:
-                config["project"] = self.form_project
-            if self.form_dataset:
-                config["dataset"] = self.form_dataset
-            if self.form_keyfile_json:
-                config["keyfile_json"] = self.form_keyfile_json
-
-        elif t == "snowflake":
-            if self.form_account:
-                config["account"] = self.form_account
-            if self.form_user:
-                config["user"] = self.form_user
-            if self.form_password:
-                config["password"] = self.form_password
-            if self.form_database:
-                config["database"] = self.form_database
-            if self.form_warehouse:
-                config["warehouse"] = self.form_warehouse
-            if self.form_role:
-                config["role"] = self.form_role
-            if self.form_schema:
-                config["schema"] = self.form_schema
-
-        elif t == "s3":
-            if self.form_bucket_url:
-                config["bucket_url"] = self.form_bucket_url
-            if self.form_aws_access_key_id:
-                config["aws_access_key_id"] = self.form_aws_access_key_id
-            if self.form_aws_secret_access_key:
-                config["aws_secret_access_key"] = self.form_aws_secret_access_key
-            if self.form_region_name:
-                config["region_name"] = self.form_region_name
-            if self.form_endpoint_url:
-                config["endpoint_url"] = self.form_endpoint_url
-
-        elif t in ("csv", "json", "parquet"):
-            if self.form_uploaded_file_id:
-                config["uploaded_file_id"] = self.form_uploaded_file_id
-            if self.form_bucket_url:
-                config["bucket_url"] = self.form_bucket_url
-
-        elif t == "google_sheets":
-            if self.form_spreadsheet_url:
-                config["spreadsheet_url"] = self.form_spreadsheet_url
-            if self.form_service_account_json:
-                config["service_account_json"] = self.form_service_account_json
-
-        elif t == "rest_api":
-            if self.form_base_url:
-                config["base_url"] = self.form_base_url
-            if self.form_api_key:
-                config["api_key"] = self.form_api_key
-            if self.form_extra_headers:
-                config["extra_headers"] = self.form_extra_headers
-
-        elif t == "mongodb":
-            if self.form_host:
-                config["host"] = self.form_host
-            if self.form_port:
-                config["port"] = int(self.form_port)
-            if self.form_user:
-                config["user"] = self.form_user
-            if self.form_password:
-                config["password"] = self.form_password
-            if self.form_database:
-                config["database"] = self.form_database
-
+        for key, attr, coerce in _CONFIG_FIELDS.get(self.form_type, ()):
+            value = getattr(self, attr)
+            if value:
+                config[key] = coerce(value) if coerce else value
         return config
 
     def _reset_form_fields(self):
@@ -424,7 +408,7 @@ class ConnectionState(BaseState):
         self.form_config = "{}"
         self.form_use_raw_json = False
         self.form_host = ""
-        self.form_port = _DEFAULT_PORTS.get("postgres", "")
+        self.form_port = _DEFAULT_PORTS["postgres"]
         self.form_user = ""
         self.form_password = ""
         self.form_database = ""
@@ -528,7 +512,7 @@ class ConnectionState(BaseState):
             self.form_extra_headers = config.get("extra_headers", "")
         elif conn_type == "mongodb":
             self.form_host = config.get("host", "")
-            self.form_port = str(config.get("port", _DEFAULT_PORTS.get("mongodb", "")))
+            self.form_port = str(config.get("port", _DEFAULT_PORTS["mongodb"]))
             self.form_user = config.get("user", "")
             self.form_password = config.get("password", "")
             self.form_database = config.get("database", "")
@@ -40,6 +40,11 @@ def _validate_column_tests(tests: list) -> str | None:
     return None
 
 
+def _parse_csv_values(text: str) -> list[str]:
+    """Split a comma-separated string into trimmed, non-empty values."""
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+
 def _recompute_columns(columns: list["ColumnItem"]) -> list["ColumnItem"]:
     """Scan tests list on each column and populate computed display fields."""
     result = []
@@ -296,7 +301,7 @@ class ModelDetailState(BaseState):
         test_type = self.custom_test_type
         # Native dbt tests (no prefix)
         if test_type == "accepted_values":
-            values = [v.strip() for v in self.custom_test_expression.split(",") if v.strip()]
+            values = _parse_csv_values(self.custom_test_expression)
             if not values:
                 return None
             return {"accepted_values": {"values": values}}
@@ -382,7 +387,7 @@ class ModelDetailState(BaseState):
             dbt_config["alias"] = self.form_alias.strip()
         else:
             dbt_config.pop("alias", None)
-        parsed_tags = [t.strip() for t in self.form_tags.split(",") if t.strip()]
+        parsed_tags = _parse_csv_values(self.form_tags)
         if parsed_tags:
             dbt_config["tags"] = parsed_tags
         else:
@@ -1,7 +1,7 @@
 """Pipeline state for Reflex UI — dbt pipeline orchestration."""
 
 import reflex as rx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from datanika.config import settings
 from datanika.models.dependency import NodeType
@@ -17,6 +17,8 @@ from datanika.ui.state.connection_state import DESTINATION_TYPES
 
 
 class PipelineItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int = 0
     name: str = ""
     description: str = ""
@@ -1,6 +1,6 @@
 """Run state for Reflex UI."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from datanika.config import settings
 from datanika.models.dependency import NodeType
@@ -15,6 +15,8 @@ from datanika.ui.state.base_state import BaseState, get_sync_session
 
 
 class RunItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int = 0
     target_type: str = ""
     target_id: int = 0
@@ -3,7 +3,7 @@
 import re
 
 import reflex as rx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from datanika.config import settings
 from datanika.models.transformation import Materialization
@@ -20,6 +20,8 @@ _SOURCE_SCHEMA_PATTERN = re.compile(r"""\{\{\s*source\(\s*['"]([^'"]*?)$""")
 
 
 class TransformationItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int = 0
     name: str = ""
     description: str = ""
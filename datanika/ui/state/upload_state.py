@@ -4,7 +4,7 @@ import json
 import re
 
 import reflex as rx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from datanika.config import settings
 from datanika.models.dependency import NodeType
@@ -18,6 +18,8 @@ from datanika.ui.state.connection_state import DESTINATION_TYPES, SOURCE_TYPES
 
 
 class UploadItem(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int = 0
     name: str = ""
     description: str = ""
@@ -5,6 +5,13 @@ from sqlalchemy.orm import Session
 from datanika.models.base import Base
 
 
+def pytest_collection_modifyitems(items):
+    """Mark every test that uses the SQLite engine as ``db`` so ``-m "not db"`` skips it."""
+    for item in items:
+        if "engine" in item.fixturenames:
+            item.add_marker(pytest.mark.db)
+
+
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
@@ -12,7 +19,11 @@ def anyio_backend():
 
 @pytest.fixture(scope="session")
 def engine():
-    """SQLite in-memory engine for fast model tests."""
+    """SQLite in-memory engine for fast model tests.
+
+    In-memory databases are private to the process, so each pytest-xdist
+    worker (``pytest -n auto``) gets its own isolated database.
+    """
     eng = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(eng)
     return eng
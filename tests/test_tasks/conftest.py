@@ -0,0 +1,14 @@
+import base64
+
+import pytest
+
+from datanika.services.encryption import EncryptionService
+
+# Fixed 32-byte Fernet key: deterministic across runs and skips the urandom read.
+_TEST_FERNET_KEY = base64.urlsafe_b64encode(b"0" * 32).decode()
+
+
+@pytest.fixture(scope="session")
+def encryption():
+    """Session-wide EncryptionService backed by a fixed test key."""
+    return EncryptionService(_TEST_FERNET_KEY)
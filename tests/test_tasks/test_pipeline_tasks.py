@@ -4,7 +4,6 @@ import uuid
 from unittest.mock import MagicMock, patch
 
 import pytest
-from cryptography.fernet import Fernet
 
 from datanika.models.connection import Connection, ConnectionDirection, ConnectionType
 from datanika.models.dependency import NodeType
@@ -13,17 +12,10 @@ from datanika.models.run import RunStatus
 from datanika.models.transformation import Materialization, Transformation
 from datanika.models.user import Organization
 from datanika.services.catalog_service import CatalogService
-from datanika.services.encryption import EncryptionService
 from datanika.services.execution_service import ExecutionService
 from datanika.tasks.pipeline_tasks import run_pipeline
 
 
-@pytest.fixture
-def encryption():
-    key = Fernet.generate_key().decode()
-    return EncryptionService(key)
-
-
 @pytest.fixture
 def exec_svc():
     return ExecutionService()
@@ -1,9 +1,8 @@
 """TDD tests for transformation Celery tasks."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from cryptography.fernet import Fernet
 
 from datanika.models.connection import Connection, ConnectionDirection, ConnectionType
 from datanika.models.dependency import NodeType
@@ -11,7 +10,6 @@ from datanika.models.run import RunStatus
 from datanika.models.transformation import Materialization
 from datanika.models.user import Organization
 from datanika.services.catalog_service import CatalogService
-from datanika.services.encryption import EncryptionService
 from datanika.services.execution_service import ExecutionService
 from datanika.services.transformation_service import TransformationService
 from datanika.tasks.transformation_tasks import (
@@ -20,12 +18,6 @@ from datanika.tasks.transformation_tasks import (
 )
 
 
-@pytest.fixture
-def encryption():
-    key = Fernet.generate_key().decode()
-    return EncryptionService(key)
-
-
 @pytest.fixture
 def transform_svc():
     return TransformationService()
@@ -58,9 +50,22 @@ def setup_transformation(transform_svc, exec_svc, db_session):
     return org, transformation, run
 
 
+# DbtProjectService methods run_transformation calls; anything else raises AttributeError.
+_DBT_PROJECT_METHODS = [
+    "ensure_project",
+    "generate_profiles_yml",
+    "write_model",
+    "run_model",
+    "write_model_yml",
+]
+
+
 def _mock_dbt_project():
     """Return a patch context that mocks DbtProjectService for transformation task tests."""
-    return patch("datanika.tasks.transformation_tasks.DbtProjectService")
+    return patch(
+        "datanika.tasks.transformation_tasks.DbtProjectService",
+        return_value=Mock(spec=_DBT_PROJECT_METHODS),
+    )
 
 
 class TestRunTransformationTask:
@@ -133,56 +138,68 @@ class TestRunTransformationTask:
         assert run.status == RunStatus.FAILED
         assert "not found" in run.error_message.lower()
 
+    @pytest.mark.fast
     def test_celery_task_exists(self):
         from datanika.tasks.transformation_tasks import run_transformation_task
 
         assert run_transformation_task.name == "datanika.run_transformation"
 
 
-class TestCatalogSyncAfterTransformation:
-    def test_syncs_catalog_after_success(self, db_session, setup_transformation):
-        org, transformation, run = setup_transformation
-        with _mock_dbt_project() as mock_dbt_cls:
-            instance = mock_dbt_cls.return_value
-            instance.run_model.return_value = {
-                "success": True,
-                "rows_affected": 10,
-                "logs": "ok",
-            }
-            run_transformation(run_id=run.id, org_id=org.id, session=db_session)
-        db_session.refresh(run)
-        assert run.status == RunStatus.SUCCESS
-        entries = CatalogService.list_entries(db_session, org.id)
-        assert len(entries) == 1
-        assert entries[0].table_name == "test_model"
-        assert entries[0].origin_type == NodeType.TRANSFORMATION
+def _assert_catalog_synced(db_session, org, run, dbt_instance):
+    db_session.refresh(run)
+    assert run.status == RunStatus.SUCCESS
+    entries = CatalogService.list_entries(db_session, org.id)
+    assert len(entries) == 1
+    assert entries[0].table_name == "test_model"
+    assert entries[0].origin_type == NodeType.TRANSFORMATION
 
-    def test_writes_model_yml_after_success(self, db_session, setup_transformation):
-        org, transformation, run = setup_transformation
-        with _mock_dbt_project() as mock_dbt_cls:
-            instance = mock_dbt_cls.return_value
-            instance.run_model.return_value = {
-                "success": True,
-                "rows_affected": 5,
-                "logs": "",
-            }
-            run_transformation(run_id=run.id, org_id=org.id, session=db_session)
-        instance.write_model_yml.assert_called_once()
 
-    def test_catalog_sync_failure_does_not_fail_run(self, db_session, setup_transformation):
+def _assert_model_yml_written(db_session, org, run, dbt_instance):
+    dbt_instance.write_model_yml.assert_called_once()
+
+
+def _assert_run_survives_sync_failure(db_session, org, run, dbt_instance):
+    db_session.refresh(run)
+    assert run.status == RunStatus.SUCCESS
+    assert run.rows_loaded == 3
+
+
+class TestCatalogSyncAfterTransformation:
+    @pytest.mark.parametrize(
+        "run_result,yml_side_effect,assertion_fn",
+        [
+            (
+                {"success": True, "rows_affected": 10, "logs": "ok"},
+                None,
+                _assert_catalog_synced,
+            ),
+            (
+                {"success": True, "rows_affected": 5, "logs": ""},
+                None,
+                _assert_model_yml_written,
+            ),
+            (
+                {"success": True, "rows_affected": 3, "logs": ""},
+                RuntimeError("yml write failed"),
+                _assert_run_survives_sync_failure,
+            ),
+        ],
+        ids=[
+            "syncs_catalog_after_success",
+            "writes_model_yml_after_success",
+            "catalog_sync_failure_does_not_fail_run",
+        ],
+    )
+    def test_catalog_sync_after_run(
+        self, db_session, setup_transformation, run_result, yml_side_effect, assertion_fn
+    ):
         org, transformation, run = setup_transformation
         with _mock_dbt_project() as mock_dbt_cls:
             instance = mock_dbt_cls.return_value
-            instance.run_model.return_value = {
-                "success": True,
-                "rows_affected": 3,
-                "logs": "",
-            }
-            instance.write_model_yml.side_effect = RuntimeError("yml write failed")
+            instance.run_model.return_value = run_result
+            instance.write_model_yml.side_effect = yml_side_effect
             run_transformation(run_id=run.id, org_id=org.id, session=db_session)
-        db_session.refresh(run)
-        assert run.status == RunStatus.SUCCESS
-        assert run.rows_loaded == 3
+        assertion_fn(db_session, org, run, instance)
 
     def test_transformation_catalog_sync_introspects_columns(
         self, db_session, encryption
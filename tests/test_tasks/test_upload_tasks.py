@@ -1,9 +1,8 @@
 """TDD tests for upload Celery tasks (mocked dlt)."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
-from cryptography.fernet import Fernet
 
 from datanika.models.connection import ConnectionDirection, ConnectionType
 from datanika.models.dependency import NodeType
@@ -12,18 +11,12 @@ from datanika.models.upload import UploadStatus
 from datanika.models.user import Organization
 from datanika.services.catalog_service import CatalogService
 from datanika.services.connection_service import ConnectionService
-from datanika.services.encryption import EncryptionService
+from datanika.services.dbt_project import DbtProjectService
 from datanika.services.execution_service import ExecutionService
 from datanika.services.upload_service import UploadService
 from datanika.tasks.upload_tasks import run_upload
 
 
-@pytest.fixture
-def encryption():
-    key = Fernet.generate_key().decode()
-    return EncryptionService(key)
-
-
 @pytest.fixture
 def conn_svc(encryption):
     return ConnectionService(encryption)
@@ -81,7 +74,31 @@ def setup_upload(upload_svc, conn_svc, exec_svc, db_session, encryption):
 
 def _mock_dlt_runner():
     """Return a patch context that mocks DltRunnerService.execute for upload task tests."""
-    return patch("datanika.tasks.upload_tasks.DltRunnerService")
+    return patch(
+        "datanika.tasks.upload_tasks.DltRunnerService",
+        return_value=Mock(spec=["execute"]),
+    )
+
+
+@pytest.fixture(scope="module")
+def _catalog_templates():
+    """Autospec templates built once per module and reused by every catalog-sync test."""
+    introspect = create_autospec(CatalogService.introspect_tables, spec_set=True)
+    dbt_cls = create_autospec(DbtProjectService)
+    return introspect, dbt_cls
+
+
+@pytest.fixture
+def catalog_mocks(_catalog_templates, monkeypatch):
+    """Install the cached templates for one test; returns (introspect, dbt_instance)."""
+    introspect, dbt_cls = _catalog_templates
+    introspect.reset_mock()
+    introspect.return_value = []
+    introspect.side_effect = None
+    dbt_cls.reset_mock()
+    monkeypatch.setattr(CatalogService, "introspect_tables", staticmethod(introspect))
+    monkeypatch.setattr("datanika.tasks.upload_tasks.DbtProjectService", dbt_cls)
+    return introspect, dbt_cls.return_value
 
 
 class TestRunUploadTask:
@@ -253,28 +270,15 @@ class TestRunUploadTask:
 
 
 class TestCatalogSyncAfterUpload:
-    def _run_with_catalog_mocks(self, db_session, setup_upload, introspect_result=None):
+    def _run_with_catalog_mocks(self, db_session, setup_upload, catalog_mocks):
         """Run upload with mocked DLT + mocked catalog introspection."""
         org, upload, run, encryption = setup_upload
-        if introspect_result is None:
-            introspect_result = [
-                {"table_name": "users", "columns": [{"name": "id", "data_type": "INTEGER"}]},
-            ]
-
-        mock_dbt_instance = MagicMock()
-
-        with (
-            _mock_dlt_runner() as mock_runner_cls,
-            patch.object(
-                CatalogService,
-                "introspect_tables",
-                return_value=introspect_result,
-            ) as mock_introspect,
-            patch(
-                "datanika.tasks.upload_tasks.DbtProjectService",
-                return_value=mock_dbt_instance,
-            ),
-        ):
+        mock_introspect, mock_dbt_instance = catalog_mocks
+        mock_introspect.return_value = [
+            {"table_name": "users", "columns": [{"name": "id", "data_type": "INTEGER"}]},
+        ]
+
+        with _mock_dlt_runner() as mock_runner_cls:
             instance = mock_runner_cls.return_value
             instance.execute.return_value = {
                 "rows_loaded": 10,
@@ -288,10 +292,11 @@ class TestCatalogSyncAfterUpload:
             )
         return org, upload, run, mock_introspect, mock_dbt_instance
 
-    def test_syncs_catalog_entries_after_success(self, db_session, setup_upload):
+    def test_syncs_catalog_entries_after_success(self, db_session, setup_upload, catalog_mocks):
         org, upload, run, mock_introspect, _ = self._run_with_catalog_mocks(
             db_session,
             setup_upload,
+            catalog_mocks,
         )
         db_session.refresh(run)
         assert run.status == RunStatus.SUCCESS
@@ -301,23 +306,19 @@ class TestCatalogSyncAfterUpload:
         assert len(entries) == 1
         assert entries[0].table_name == "users"
 
-    def test_source_yml_written_after_success(self, db_session, setup_upload):
+    def test_source_yml_written_after_success(self, db_session, setup_upload, catalog_mocks):
         _, _, _, _, mock_dbt_instance = self._run_with_catalog_mocks(
             db_session,
             setup_upload,
+            catalog_mocks,
         )
         mock_dbt_instance.write_source_yml_for_connection.assert_called_once()
 
-    def test_catalog_sync_failure_does_not_fail_run(self, db_session, setup_upload):
+    def test_catalog_sync_failure_does_not_fail_run(self, db_session, setup_upload, catalog_mocks):
         org, upload, run, encryption = setup_upload
-        with (
-            _mock_dlt_runner() as mock_runner_cls,
-            patch.object(
-                CatalogService,
-                "introspect_tables",
-                side_effect=RuntimeError("introspect failed"),
-            ),
-        ):
+        mock_introspect, _ = catalog_mocks
+        mock_introspect.side_effect = RuntimeError("introspect failed")
+        with _mock_dlt_runner() as mock_runner_cls:
             instance = mock_runner_cls.return_value
             instance.execute.return_value = {
                 "rows_loaded": 5,
@@ -0,0 +1,100 @@
+import inspect
+import json
+from functools import cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
+
+import pytest
+
+# Import the Reflex state modules once, before any test module in this package is
+# collected, so the metaclass/event-handler setup happens in one place and every
+# test file's own imports are plain sys.modules hits.
+from datanika.ui.state import auth_state, run_state, transformation_state  # noqa: F401
+from datanika.ui.state.model_detail_state import ColumnItem, _recompute_columns
+
+_UI_TESTS = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    """Mark every UI state test as ``fast`` — none of them touch the DB or do IO."""
+    for item in items:
+        if _UI_TESTS in item.path.parents:
+            item.add_marker(pytest.mark.fast)
+
+
+@pytest.fixture(scope="session")
+def state_classes():
+    """The Reflex State classes UI tests take by fixture, resolved from the imports above."""
+    return SimpleNamespace(Transformation=transformation_state.TransformationState)
+
+
+@pytest.fixture(scope="session")
+def sample_cols():
+    """Session-wide ``id`` ColumnItem prototypes.
+
+    Shared across the session, so never mutate them; work on the fresh copies
+    ``_recompute_columns`` returns instead.
+    """
+    return {
+        "id_nn": ColumnItem.model_construct(name="id", tests=["not_null"]),
+        "id_nn_u": ColumnItem.model_construct(name="id", tests=["not_null", "unique"]),
+        "id_empty": ColumnItem.model_construct(name="id", tests=[]),
+    }
+
+
+@pytest.fixture(scope="module")
+def recompute_cache():
+    """Return ``get(tests, name="x")`` that recomputes each distinct column once per module.
+
+    Results are shared between tests, so only use this for read-only assertions.
+    """
+    cache = {}
+
+    def get(tests, name="x"):
+        key = (
+            name,
+            tuple(t if isinstance(t, str) else json.dumps(t, sort_keys=True) for t in tests),
+        )
+        if key not in cache:
+            col = ColumnItem.model_construct(name=name, tests=list(tests))
+            cache[key] = _recompute_columns([col])[0]
+        return cache[key]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def run_state_fields():
+    """RunState field names, resolved once per session."""
+    return frozenset(run_state.RunState.get_fields())
+
+
+class _HandlerInfo(NamedTuple):
+    handler: object
+    fn: object
+    signature: inspect.Signature | None
+    is_coroutine: bool
+    is_asyncgen: bool
+
+
+@cache
+def _handler_info(cls, name):
+    handler = getattr(cls, name, None)
+    fn = getattr(handler, "fn", handler)
+    return _HandlerInfo(
+        handler,
+        fn,
+        inspect.signature(fn) if callable(fn) else None,
+        inspect.iscoroutinefunction(fn),
+        inspect.isasyncgenfunction(fn),
+    )
+
+
+@pytest.fixture(scope="session")
+def handler_info():
+    """Return ``get(cls, name)``: a State event handler, its unwrapped fn and signature.
+
+    Each ``(cls, name)`` is introspected once per process.
+    """
+    return _handler_info
@@ -1,5 +1,7 @@
 """Tests for auth-related rx.Base data model classes and AuthState fields."""
 
+import pytest
+
 from datanika.ui.state.auth_state import AuthState, OrgInfo, UserInfo
 
 
@@ -31,44 +33,31 @@ class TestOrgInfo:
         assert info.slug == ""
 
 
-class TestAuthStateFields:
-    def test_access_token_default(self):
-        assert AuthState.__fields__["access_token"].default == ""
+_FIELDS = AuthState.__fields__
+_DEFAULTS = {
+    name: field.default_factory() if field.default_factory else field.default
+    for name, field in _FIELDS.items()
+}
 
-    def test_refresh_token_default(self):
-        assert AuthState.__fields__["refresh_token"].default == ""
+
+class TestAuthStateFields:
+    @pytest.mark.parametrize("name", ["access_token", "refresh_token", "auth_error"])
+    def test_string_field_default(self, name):
+        assert _DEFAULTS[name] == ""
 
     def test_current_user_default(self):
-        field = AuthState.__fields__["current_user"]
-        default = field.default_factory() if field.default_factory else field.default
+        default = _DEFAULTS["current_user"]
         assert isinstance(default, UserInfo)
         assert default.id == 0
 
     def test_current_org_default(self):
-        field = AuthState.__fields__["current_org"]
-        default = field.default_factory() if field.default_factory else field.default
+        default = _DEFAULTS["current_org"]
         assert isinstance(default, OrgInfo)
         assert default.id == 0
 
 
 class TestAuthStateFormFields:
-    def test_auth_error_default(self):
-        assert AuthState.__fields__["auth_error"].default == ""
-
-    def test_login_accepts_form_data(self):
-        """login() accepts a form_data dict (from rx.form on_submit)."""
-        import inspect
-
-        fn = AuthState.login.fn if hasattr(AuthState.login, "fn") else AuthState.login
-        sig = inspect.signature(fn)
-        params = list(sig.parameters.keys())
-        assert "form_data" in params
-
-    def test_signup_accepts_form_data(self):
-        """signup() accepts a form_data dict (from rx.form on_submit)."""
-        import inspect
-
-        fn = AuthState.signup.fn if hasattr(AuthState.signup, "fn") else AuthState.signup
-        sig = inspect.signature(fn)
-        params = list(sig.parameters.keys())
-        assert "form_data" in params
+    @pytest.mark.parametrize("name", ["login", "signup"])
+    def test_accepts_form_data(self, handler_info, name):
+        """login()/signup() accept a form_data dict (from rx.form on_submit)."""
+        assert "form_data" in handler_info(AuthState, name).signature.parameters
@@ -1,81 +1,134 @@
 """Tests for column-level editing state handlers in ModelDetailState."""
 
+import pytest
+
 from datanika.ui.state.model_detail_state import (
     ColumnItem,
+    ModelDetailState,
+    _parse_csv_values,
     _recompute_columns,
     _validate_column_tests,
 )
 
 
-# ---------------------------------------------------------------------------
-# _recompute_columns — sets display fields from tests list
-# ---------------------------------------------------------------------------
-class TestColumnRecompute:
-    def test_empty_tests_all_false(self):
-        cols = [ColumnItem(name="id", data_type="INT", tests=[])]
-        result = _recompute_columns(cols)
-        assert result[0].has_not_null is False
-        assert result[0].has_unique is False
-        assert result[0].accepted_values_csv == ""
-        assert result[0].relationship_to == ""
-        assert result[0].relationship_field == ""
-
-    def test_not_null_detected(self):
-        cols = [ColumnItem(name="id", tests=["not_null"])]
-        result = _recompute_columns(cols)
-        assert result[0].has_not_null is True
-        assert result[0].has_unique is False
+def _col(**kw):
+    """Build a ColumnItem without validation; _recompute_columns fills the computed fields."""
+    return ColumnItem.model_construct(**kw)
 
-    def test_unique_detected(self):
-        cols = [ColumnItem(name="id", tests=["unique"])]
-        result = _recompute_columns(cols)
-        assert result[0].has_unique is True
 
-    def test_both_not_null_and_unique(self):
-        cols = [ColumnItem(name="id", tests=["not_null", "unique"])]
-        result = _recompute_columns(cols)
-        assert result[0].has_not_null is True
-        assert result[0].has_unique is True
+def _mutate_tests(col, tests):
+    """Swap ``col.tests`` in place; fall back to a copy should ColumnItem ever become frozen."""
+    if ColumnItem.model_config.get("frozen"):
+        return col.model_copy(update={"tests": tests})
+    object.__setattr__(col, "tests", tests)
+    return col
 
-    def test_accepted_values_csv(self):
-        cols = [
-            ColumnItem(
-                name="status",
-                tests=[{"accepted_values": {"values": ["active", "inactive", "pending"]}}],
-            )
-        ]
-        result = _recompute_columns(cols)
-        assert result[0].accepted_values_csv == "active, inactive, pending"
 
-    def test_relationship_fields(self):
-        cols = [
-            ColumnItem(
-                name="user_id",
-                tests=[{"relationships": {"to": "ref('users')", "field": "id"}}],
-            )
-        ]
-        result = _recompute_columns(cols)
-        assert result[0].relationship_to == "ref('users')"
-        assert result[0].relationship_field == "id"
+def _add_test(col, test_entry):
+    """Simulate what add_custom_test does: drop any test of the same type, then append."""
+    key = next(iter(test_entry), "")
+    new_tests = [t for t in col.tests if not (isinstance(t, dict) and next(iter(t), "") == key)]
+    new_tests.append(test_entry)
+    return _mutate_tests(col, new_tests)
 
-    def test_mixed_tests(self):
-        cols = [
-            ColumnItem(
-                name="user_id",
-                tests=[
-                    "not_null",
-                    {"relationships": {"to": "ref('users')", "field": "id"}},
-                ],
-            )
-        ]
-        result = _recompute_columns(cols)
-        assert result[0].has_not_null is True
-        assert result[0].relationship_to == "ref('users')"
 
-    def test_multiple_columns(self):
+# ---------------------------------------------------------------------------
+# _recompute_columns — sets display fields from tests list
+# ---------------------------------------------------------------------------
+_RECOMPUTE_CASES = [
+    (
+        "empty_tests_all_false",
+        [],
+        {
+            "has_not_null": False,
+            "has_unique": False,
+            "accepted_values_csv": "",
+            "relationship_to": "",
+            "relationship_field": "",
+        },
+    ),
+    ("not_null_detected", ["not_null"], {"has_not_null": True, "has_unique": False}),
+    ("unique_detected", ["unique"], {"has_unique": True}),
+    (
+        "both_not_null_and_unique",
+        ["not_null", "unique"],
+        {"has_not_null": True, "has_unique": True},
+    ),
+    (
+        "accepted_values_csv",
+        [{"accepted_values": {"values": ["active", "inactive", "pending"]}}],
+        {"accepted_values_csv": "active, inactive, pending"},
+    ),
+    (
+        "relationship_fields",
+        [{"relationships": {"to": "ref('users')", "field": "id"}}],
+        {"relationship_to": "ref('users')", "relationship_field": "id"},
+    ),
+    (
+        "mixed_tests",
+        ["not_null", {"relationships": {"to": "ref('users')", "field": "id"}}],
+        {"has_not_null": True, "relationship_to": "ref('users')"},
+    ),
+    (
+        # dbt_utils tests don't affect simple booleans
+        "dbt_utils_test_preserved",
+        ["not_null", {"dbt_utils.expression_is_true": {"expression": "amount > 0"}}],
+        {"has_not_null": True, "has_unique": False},
+    ),
+    (
+        "additional_tests_populated",
+        [
+            "not_null",
+            {"dbt_utils.expression_is_true": {"expression": "amount > 0"}},
+            {"dbt_utils.accepted_range": {"min_value": 0, "max_value": 100}},
+        ],
+        {"additional_tests": ["dbt_utils.expression_is_true", "dbt_utils.accepted_range"]},
+    ),
+    (
+        # All dict tests (including accepted_values/relationships) appear in additional_tests
+        "additional_tests_includes_all_dict_tests",
+        [
+            "not_null",
+            {"accepted_values": {"values": ["a", "b"]}},
+            {"relationships": {"to": "ref('users')", "field": "id"}},
+            {"dbt_utils.not_constant": {}},
+        ],
+        {"additional_tests": ["accepted_values", "relationships", "dbt_utils.not_constant"]},
+    ),
+    ("additional_tests_empty_when_no_custom", ["not_null", "unique"], {"additional_tests": []}),
+    (
+        "add_expression_is_true",
+        [{"dbt_utils.expression_is_true": {"expression": "amount > 0"}}],
+        {"additional_tests": ["dbt_utils.expression_is_true"], "has_not_null": False},
+    ),
+    (
+        "add_accepted_range",
+        [{"dbt_utils.accepted_range": {"min_value": 0, "max_value": 100}}],
+        {"additional_tests": ["dbt_utils.accepted_range"], "accepted_values_csv": ""},
+    ),
+    (
+        "add_not_constant",
+        [{"dbt_utils.not_constant": {}}],
+        {"additional_tests": ["dbt_utils.not_constant"], "has_unique": False},
+    ),
+]
+
+
+class TestColumnRecompute:
+    @pytest.mark.parametrize(
+        "tests,expected",
+        [case[1:] for case in _RECOMPUTE_CASES],
+        ids=[case[0] for case in _RECOMPUTE_CASES],
+    )
+    def test_recompute(self, recompute_cache, tests, expected):
+        result = recompute_cache(tests)
+        for attr, value in expected.items():
+            assert getattr(result, attr) == value, attr
+
+    def test_multiple_columns(self, sample_cols):
         cols = [
-            ColumnItem(name="id", tests=["not_null", "unique"]),
-            ColumnItem(
+            sample_cols["id_nn_u"],
+            _col(
                 name="status",
                 tests=[
                     {"accepted_values": {"values": ["a", "b"]}},
@@ -87,178 +140,74 @@ class TestColumnRecompute:
         assert result[0].has_unique is True
         assert result[1].accepted_values_csv == "a, b"
 
-    def test_dbt_utils_test_preserved(self):
-        cols = [
-            ColumnItem(
-                name="amount",
-                tests=[
-                    "not_null",
-                    {"dbt_utils.expression_is_true": {"expression": "amount > 0"}},
-                ],
-            )
-        ]
-        result = _recompute_columns(cols)
-        assert result[0].has_not_null is True
-        # dbt_utils tests don't affect simple booleans
-        assert result[0].has_unique is False
-
-    def test_additional_tests_populated(self):
-        cols = [
-            ColumnItem(
-                name="amount",
-                tests=[
-                    "not_null",
-                    {"dbt_utils.expression_is_true": {"expression": "amount > 0"}},
-                    {"dbt_utils.accepted_range": {"min_value": 0, "max_value": 100}},
-                ],
-            )
-        ]
-        result = _recompute_columns(cols)
-        assert result[0].additional_tests == [
-            "dbt_utils.expression_is_true",
-            "dbt_utils.accepted_range",
-        ]
-
-    def test_additional_tests_includes_all_dict_tests(self):
-        """All dict tests (including accepted_values/relationships) appear in additional_tests."""
-        cols = [
-            ColumnItem(
-                name="status",
-                tests=[
-                    "not_null",
-                    {"accepted_values": {"values": ["a", "b"]}},
-                    {"relationships": {"to": "ref('users')", "field": "id"}},
-                    {"dbt_utils.not_constant": {}},
-                ],
-            )
-        ]
-        result = _recompute_columns(cols)
-        assert result[0].additional_tests == [
-            "accepted_values",
-            "relationships",
-            "dbt_utils.not_constant",
-        ]
-
-    def test_additional_tests_empty_when_no_custom(self):
-        cols = [ColumnItem(name="id", tests=["not_null", "unique"])]
-        result = _recompute_columns(cols)
-        assert result[0].additional_tests == []
-
 
 # ---------------------------------------------------------------------------
 # Toggle tests — not_null on/off, unique on/off
 # ---------------------------------------------------------------------------
 class TestToggleTests:
-    def test_toggle_not_null_on(self):
-        col = ColumnItem(name="id", tests=[])
-        cols = _recompute_columns([col])
-        # Simulate toggling on
-        tests = list(cols[0].tests)
-        tests.append("not_null")
-        updated = _recompute_columns([cols[0].model_copy(update={"tests": tests})])
-        assert updated[0].has_not_null is True
+    @pytest.mark.parametrize(
+        "base,toggled,expected_nn,expected_unique",
+        [
+            ("id_empty", "not_null", True, False),
+            ("id_nn_u", "not_null", False, True),
+            ("id_nn", "unique", True, True),
+            ("id_nn_u", "unique", True, False),
+        ],
+        ids=["not_null_on", "not_null_off", "unique_on", "unique_off_preserves_others"],
+    )
+    def test_toggle(self, sample_cols, base, toggled, expected_nn, expected_unique):
+        col = _recompute_columns([sample_cols[base]])[0]
+        # Simulate the UI toggle: drop the test if present, otherwise append it
+        if toggled in col.tests:
+            tests = [t for t in col.tests if t != toggled]
+        else:
+            tests = [*col.tests, toggled]
+        updated = _recompute_columns([_mutate_tests(col, tests)])[0]
+        assert updated.has_not_null is expected_nn
+        assert updated.has_unique is expected_unique
 
-    def test_toggle_not_null_off(self):
-        col = ColumnItem(name="id", tests=["not_null", "unique"])
-        tests = [t for t in col.tests if t != "not_null"]
-        updated = _recompute_columns([col.model_copy(update={"tests": tests})])
-        assert updated[0].has_not_null is False
-        assert updated[0].has_unique is True
-
-    def test_toggle_unique_on(self):
-        col = ColumnItem(name="id", tests=["not_null"])
-        tests = list(col.tests) + ["unique"]
-        updated = _recompute_columns([col.model_copy(update={"tests": tests})])
-        assert updated[0].has_unique is True
-        assert updated[0].has_not_null is True
 
-    def test_toggle_unique_off_preserves_others(self):
-        col = ColumnItem(name="id", tests=["not_null", "unique"])
-        tests = [t for t in col.tests if t != "unique"]
-        updated = _recompute_columns([col.model_copy(update={"tests": tests})])
-        assert updated[0].has_unique is False
-        assert updated[0].has_not_null is True
+# ---------------------------------------------------------------------------
+# Removing a test — recomputed display fields reset
+# ---------------------------------------------------------------------------
+_REL = {"relationships": {"to": "ref('users')", "field": "id"}}
+
+
+def test_removing_relationship_clears_fields():
+    col = _recompute_columns([_col(name="user_id", tests=["not_null", _REL])])[0]
+    assert col.relationship_to == "ref('users')"
+    tests = [t for t in col.tests if t != _REL]
+    updated = _recompute_columns([_mutate_tests(col, tests)])[0]
+    assert updated.relationship_to == ""
+    assert updated.relationship_field == ""
+    assert updated.has_not_null is True
 
 
 # ---------------------------------------------------------------------------
 # Accepted values — CSV parsing
 # ---------------------------------------------------------------------------
 class TestAcceptedValues:
-    def test_csv_parsing(self):
-        values = ["active", "inactive", "pending"]
-        col = ColumnItem(
-            name="status",
-            tests=[{"accepted_values": {"values": values}}],
-        )
-        result = _recompute_columns([col])
-        assert result[0].accepted_values_csv == "active, inactive, pending"
-
     def test_whitespace_trimmed(self):
-        csv_input = "  a ,  b , c  "
-        values = [v.strip() for v in csv_input.split(",") if v.strip()]
-        assert values == ["a", "b", "c"]
-
-    def test_empty_csv_removes_test(self):
-        csv_input = ""
-        values = [v.strip() for v in csv_input.split(",") if v.strip()]
-        assert values == []
-        col = ColumnItem(name="status", tests=[])
-        result = _recompute_columns([col])
-        assert result[0].accepted_values_csv == ""
-
+        assert _parse_csv_values("  a ,  b , c  ") == ["a", "b", "c"]
 
-# ---------------------------------------------------------------------------
-# Relationships — set to/field, clear removes
-# ---------------------------------------------------------------------------
-class TestRelationships:
-    def test_set_relationship(self):
-        col = ColumnItem(
-            name="user_id",
-            tests=[{"relationships": {"to": "ref('users')", "field": "id"}}],
-        )
-        result = _recompute_columns([col])
-        assert result[0].relationship_to == "ref('users')"
-        assert result[0].relationship_field == "id"
+    def test_empty_csv_yields_no_values(self):
+        assert _parse_csv_values("") == []
 
-    def test_clear_relationship(self):
-        col = ColumnItem(name="user_id", tests=[])
-        result = _recompute_columns([col])
-        assert result[0].relationship_to == ""
-        assert result[0].relationship_field == ""
+    def test_blank_entries_dropped(self):
+        assert _parse_csv_values("a, , b,") == ["a", "b"]
 
 
 # ---------------------------------------------------------------------------
-# Custom tests — add/remove dbt_utils tests
+# Custom tests — remove dbt_utils tests
 # ---------------------------------------------------------------------------
 class TestCustomTests:
-    def test_add_expression_is_true(self):
-        test_entry = {"dbt_utils.expression_is_true": {"expression": "amount > 0"}}
-        col = ColumnItem(name="amount", tests=[test_entry])
-        result = _recompute_columns([col])
-        assert len(result[0].tests) == 1
-        assert "dbt_utils.expression_is_true" in result[0].tests[0]
-
-    def test_add_accepted_range(self):
-        test_entry = {"dbt_utils.accepted_range": {"min_value": 0, "max_value": 100}}
-        col = ColumnItem(name="score", tests=[test_entry])
-        result = _recompute_columns([col])
-        assert len(result[0].tests) == 1
-
-    def test_add_not_constant(self):
-        test_entry = {"dbt_utils.not_constant": {}}
-        col = ColumnItem(name="status", tests=[test_entry])
-        result = _recompute_columns([col])
-        assert len(result[0].tests) == 1
-
     def test_remove_custom_test(self):
         tests = [
             "not_null",
             {"dbt_utils.expression_is_true": {"expression": "x > 0"}},
         ]
-        col = ColumnItem(name="x", tests=tests)
+        col = _col(name="x", tests=tests)
         # Remove the custom test using the display key (same as UI passes)
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
         updated = ModelDetailState._remove_test_by_display(col, "dbt_utils.expression_is_true")
         updated = _recompute_columns([updated])
         assert updated[0].has_not_null is True
@@ -271,9 +220,7 @@ class TestCustomTests:
             {"dbt_utils.expression_is_true": {"expression": "x > 0"}},
             {"dbt_utils.not_constant": {}},
         ]
-        col = ColumnItem(name="x", tests=tests)
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
+        col = _col(name="x", tests=tests)
         updated = ModelDetailState._remove_test_by_display(col, "dbt_utils.expression_is_true")
         updated = _recompute_columns([updated])
         assert updated[0].has_not_null is True
@@ -285,60 +232,49 @@ class TestCustomTests:
 # Validation
 # ---------------------------------------------------------------------------
 class TestValidation:
-    def test_valid_standard_tests(self):
-        tests = ["not_null", "unique"]
-        assert _validate_column_tests(tests) is None
-
-    def test_valid_accepted_values(self):
-        tests = [{"accepted_values": {"values": ["a", "b"]}}]
-        assert _validate_column_tests(tests) is None
-
-    def test_valid_relationships(self):
-        tests = [{"relationships": {"to": "ref('users')", "field": "id"}}]
-        assert _validate_column_tests(tests) is None
-
-    def test_valid_dbt_utils_test(self):
-        tests = [{"dbt_utils.expression_is_true": {"expression": "x > 0"}}]
-        assert _validate_column_tests(tests) is None
-
-    def test_invalid_string_test(self):
-        tests = ["invalid_test_name"]
-        result = _validate_column_tests(tests)
-        assert result is not None
-        assert "invalid_test_name" in result
-
-    def test_invalid_dict_test(self):
-        tests = [{"unknown_test": {}}]
+    @pytest.mark.parametrize(
+        "tests,expect_none,must_contain",
+        [
+            (["not_null", "unique"], True, None),
+            ([{"accepted_values": {"values": ["a", "b"]}}], True, None),
+            ([{"relationships": {"to": "ref('users')", "field": "id"}}], True, None),
+            ([{"dbt_utils.expression_is_true": {"expression": "x > 0"}}], True, None),
+            (["invalid_test_name"], False, "invalid_test_name"),
+            ([{"unknown_test": {}}], False, None),
+            (["not_null", "bad_test"], False, "bad_test"),
+            ([], True, None),
+        ],
+        ids=[
+            "valid_standard_tests",
+            "valid_accepted_values",
+            "valid_relationships",
+            "valid_dbt_utils_test",
+            "invalid_string_test",
+            "invalid_dict_test",
+            "mixed_valid_and_invalid",
+            "empty_tests_valid",
+        ],
+    )
+    def test_validate(self, tests, expect_none, must_contain):
         result = _validate_column_tests(tests)
-        assert result is not None
-
-    def test_mixed_valid_and_invalid(self):
-        tests = ["not_null", "bad_test"]
-        result = _validate_column_tests(tests)
-        assert result is not None
-        assert "bad_test" in result
-
-    def test_empty_tests_valid(self):
-        assert _validate_column_tests([]) is None
+        if expect_none:
+            assert result is None
+        else:
+            assert result is not None
+            if must_contain:
+                assert must_contain in result
 
 
 # ---------------------------------------------------------------------------
 # Dedup — no more than 1 test of each type per column
 # ---------------------------------------------------------------------------
 class TestDedup:
-    def _add_test(self, col, test_entry):
-        # Simulate what add_custom_test does: dedup then append
-        key = next(iter(test_entry), "")
-        new_tests = [t for t in col.tests if not (isinstance(t, dict) and next(iter(t), "") == key)]
-        new_tests.append(test_entry)
-        return col.model_copy(update={"tests": new_tests})
-
     def test_add_duplicate_replaces_existing(self):
-        col = ColumnItem(
+        col = _col(
             name="status",
             tests=[{"accepted_values": {"values": ["a", "b"]}}],
         )
-        updated = self._add_test(col, {"accepted_values": {"values": ["x", "y", "z"]}})
+        updated = _add_test(col, {"accepted_values": {"values": ["x", "y", "z"]}})
         result = _recompute_columns([updated])
         # Only one accepted_values test, with the new values
         av_tests = [t for t in result[0].tests if isinstance(t, dict) and "accepted_values" in t]
@@ -346,11 +282,11 @@ class TestDedup:
         assert av_tests[0]["accepted_values"]["values"] == ["x", "y", "z"]
 
     def test_add_duplicate_dbt_utils_replaces(self):
-        col = ColumnItem(
+        col = _col(
             name="x",
             tests=[{"dbt_utils.expression_is_true": {"expression": "x > 0"}}],
         )
-        updated = self._add_test(col, {"dbt_utils.expression_is_true": {"expression": "x > 10"}})
+        updated = _add_test(col, {"dbt_utils.expression_is_true": {"expression": "x > 10"}})
         result = _recompute_columns([updated])
         expr_tests = [
             t
@@ -361,7 +297,7 @@ class TestDedup:
         assert expr_tests[0]["dbt_utils.expression_is_true"]["expression"] == "x > 10"
 
     def test_different_types_coexist(self):
-        col = ColumnItem(
+        col = _col(
             name="user_id",
             tests=[
                 {"accepted_values": {"values": ["a"]}},
@@ -378,46 +314,49 @@ class TestDedup:
 # Form builder — accepted_values and relationships via form
 # ---------------------------------------------------------------------------
 class TestFormBuilder:
-    def test_build_accepted_values(self):
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
-        state = ModelDetailState()
+    _FORM_FIELDS = (
+        "custom_test_type",
+        "custom_test_expression",
+        "custom_test_min_value",
+        "custom_test_max_value",
+    )
+
+    @pytest.fixture(scope="class")
+    def _shared_state(self):
+        return ModelDetailState()
+
+    @pytest.fixture
+    def state(self, _shared_state):
+        """One ModelDetailState per class; form fields are reset after each test."""
+        yield _shared_state
+        for field in self._FORM_FIELDS:
+            setattr(_shared_state, field, "")
+
+    def test_build_accepted_values(self, state):
         state.custom_test_type = "accepted_values"
         state.custom_test_expression = "active, inactive, pending"
         entry = state._build_custom_test_entry()
         assert entry == {"accepted_values": {"values": ["active", "inactive", "pending"]}}
 
-    def test_build_accepted_values_trims_whitespace(self):
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
-        state = ModelDetailState()
+    def test_build_accepted_values_trims_whitespace(self, state):
         state.custom_test_type = "accepted_values"
         state.custom_test_expression = "  a ,  b , c  "
         entry = state._build_custom_test_entry()
         assert entry == {"accepted_values": {"values": ["a", "b", "c"]}}
 
-    def test_build_accepted_values_empty_returns_none(self):
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
-        state = ModelDetailState()
+    def test_build_accepted_values_empty_returns_none(self, state):
         state.custom_test_type = "accepted_values"
         state.custom_test_expression = ""
         assert state._build_custom_test_entry() is None
 
-    def test_build_relationships(self):
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
-        state = ModelDetailState()
+    def test_build_relationships(self, state):
         state.custom_test_type = "relationships"
         state.custom_test_min_value = "ref('users')"
         state.custom_test_max_value = "id"
         entry = state._build_custom_test_entry()
         assert entry == {"relationships": {"to": "ref('users')", "field": "id"}}
 
-    def test_build_relationships_empty_to_returns_none(self):
-        from datanika.ui.state.model_detail_state import ModelDetailState
-
-        state = ModelDetailState()
+    def test_build_relationships_empty_to_returns_none(self, state):
         state.custom_test_type = "relationships"
         state.custom_test_min_value = ""
         state.custom_test_max_value = "id"
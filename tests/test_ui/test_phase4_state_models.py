@@ -2,7 +2,6 @@
 
 from datanika.ui.state.dag_state import DependencyItem
 from datanika.ui.state.dashboard_state import DashboardStats
-from datanika.ui.state.run_state import RunState
 
 
 class TestDashboardStats:
@@ -60,7 +59,6 @@ class TestDependencyItem:
 
 
 class TestRunStateFilterTargetType:
-    def test_filter_target_type_field_exists(self):
+    def test_filter_target_type_field_exists(self, run_state_fields):
         """RunState should have a filter_target_type field for target type filtering."""
-        fields = RunState.get_fields()
-        assert "filter_target_type" in fields
+        assert "filter_target_type" in run_state_fields
@@ -1,11 +1,35 @@
 """Regression tests: run_upload must dispatch Celery task, not just create a Run."""
 
+from contextlib import nullcontext
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from datanika.models.dependency import NodeType
-from datanika.models.run import Run, RunStatus
+from datanika.models.run import RunStatus
+
+
+@pytest.fixture
+def upload_run_mocks(monkeypatch):
+    """Patch upload_state's session, ExecutionService and Celery task for dispatch tests."""
+    mock_run = SimpleNamespace(id=42, status=RunStatus.PENDING)
+
+    mock_exec_svc = MagicMock()
+    mock_exec_svc.create_run.return_value = mock_run
+    mock_session = MagicMock()
+    mock_task = MagicMock()
+
+    monkeypatch.setattr(
+        "datanika.ui.state.upload_state.get_sync_session", lambda: nullcontext(mock_session)
+    )
+    monkeypatch.setattr(
+        "datanika.ui.state.upload_state.ExecutionService", lambda *a, **kw: mock_exec_svc
+    )
+    monkeypatch.setattr("datanika.ui.state.upload_state.run_upload_task", mock_task)
+    return SimpleNamespace(
+        session=mock_session, exec_svc=mock_exec_svc, task=mock_task, run=mock_run
+    )
 
 
 class TestUploadRunDispatchesCeleryTask:
@@ -13,7 +37,7 @@ class TestUploadRunDispatchesCeleryTask:
     the Celery task, leaving runs stuck in pending forever."""
 
     @pytest.mark.asyncio
-    async def test_run_upload_calls_celery_delay(self):
+    async def test_run_upload_calls_celery_delay(self, upload_run_mocks):
         """After creating a run, run_upload must call run_upload_task.delay()."""
         from datanika.ui.state.upload_state import UploadState
 
@@ -28,33 +52,15 @@ class TestUploadRunDispatchesCeleryTask:
 
         state._get_org_id = fake_get_org_id
 
-        # Mock the sync session and ExecutionService
-        mock_run = MagicMock(spec=Run)
-        mock_run.id = 42
-        mock_run.status = RunStatus.PENDING
-
-        mock_exec_svc = MagicMock()
-        mock_exec_svc.create_run.return_value = mock_run
-
-        with (
-            patch("datanika.ui.state.upload_state.get_sync_session") as mock_get_session,
-            patch(
-                "datanika.ui.state.upload_state.ExecutionService",
-                return_value=mock_exec_svc,
-            ),
-            patch("datanika.ui.state.upload_state.run_upload_task") as mock_task,
-        ):
-            mock_session = MagicMock()
-            mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
-            mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-
-            async for _ in fn(state, upload_id=5):
-                pass
+        async for _ in fn(state, upload_id=5):
+            pass
 
         # Verify run was created
-        mock_exec_svc.create_run.assert_called_once_with(mock_session, 1, NodeType.UPLOAD, 5)
+        upload_run_mocks.exec_svc.create_run.assert_called_once_with(
+            upload_run_mocks.session, 1, NodeType.UPLOAD, 5
+        )
         # THE KEY ASSERTION: Celery task must be dispatched
-        mock_task.delay.assert_called_once_with(run_id=42, org_id=1)
+        upload_run_mocks.task.delay.assert_called_once_with(run_id=42, org_id=1)
 
 
 class TestScheduleStateUsesSchedulerIntegration:
@@ -1,5 +1,7 @@
 """Tests for settings-related rx.Base data model classes and SettingsState fields."""
 
+import pytest
+
 from datanika.ui.state.settings_state import MemberItem, SettingsState
 
 
@@ -23,30 +25,39 @@ class TestMemberItem:
         assert item.role == ""
 
 
+@pytest.fixture(scope="module")
+def settings_defaults():
+    """Resolve the SettingsState field defaults once per module."""
+    fields = SettingsState.__fields__
+    return {
+        name: fields[name].default_factory()
+        if fields[name].default_factory
+        else fields[name].default
+        for name in ("org_name", "org_slug", "invite_email", "invite_role", "members")
+    }
+
+
 class TestSettingsStateFields:
-    def test_org_fields_default(self):
-        assert SettingsState.__fields__["org_name"].default == ""
-        assert SettingsState.__fields__["org_slug"].default == ""
+    def test_org_fields_default(self, settings_defaults):
+        assert settings_defaults["org_name"] == ""
+        assert settings_defaults["org_slug"] == ""
 
-    def test_members_field_default(self):
-        field = SettingsState.__fields__["members"]
-        default = field.default_factory() if field.default_factory else field.default
-        assert default == []
+    def test_members_field_default(self, settings_defaults):
+        assert settings_defaults["members"] == []
 
-    def test_invite_form_fields_default(self):
-        assert SettingsState.__fields__["invite_email"].default == ""
-        assert SettingsState.__fields__["invite_role"].default == "viewer"
+    def test_invite_form_fields_default(self, settings_defaults):
+        assert settings_defaults["invite_email"] == ""
+        assert settings_defaults["invite_role"] == "viewer"
 
 
 class TestSettingsStateDefaults:
-    def test_invite_email_default(self):
-        assert SettingsState.__fields__["invite_email"].default == ""
+    def test_invite_email_default(self, settings_defaults):
+        assert settings_defaults["invite_email"] == ""
 
-    def test_invite_role_default(self):
-        assert SettingsState.__fields__["invite_role"].default == "viewer"
+    def test_invite_role_default(self, settings_defaults):
+        assert settings_defaults["invite_role"] == "viewer"
 
-    def test_members_empty(self):
-        field = SettingsState.__fields__["members"]
-        default = field.default_factory() if field.default_factory else field.default
+    def test_members_empty(self, settings_defaults):
+        default = settings_defaults["members"]
         assert isinstance(default, list)
         assert len(default) == 0
@@ -1,154 +1,180 @@
 """Tests for rx.Base data model classes used in UI state."""
 
+import copy
+import functools
+import types
+
+import pytest
+from pydantic import ValidationError
+
 from datanika.models.connection import ConnectionDirection
-from datanika.ui.state.connection_state import ConnectionItem, _infer_direction
+from datanika.ui.state.connection_state import ConnectionItem, ConnectionState, _infer_direction
 from datanika.ui.state.run_state import RunItem
 from datanika.ui.state.schedule_state import ScheduleItem
 from datanika.ui.state.transformation_state import TransformationItem
 from datanika.ui.state.upload_state import UploadItem
 
-
-class TestConnectionItem:
-    def test_create_with_fields(self):
-        item = ConnectionItem(id=1, name="My DB", connection_type="postgres")
-        assert item.id == 1
-        assert item.name == "My DB"
-        assert item.connection_type == "postgres"
-
-    def test_defaults(self):
-        item = ConnectionItem()
-        assert item.id == 0
-        assert item.name == ""
-        assert item.connection_type == ""
+_ITEM_CASES = [
+    (ConnectionItem, {"id": 1, "name": "My DB", "connection_type": "postgres"}),
+    (
+        UploadItem,
+        {
+            "id": 5,
+            "name": "ETL",
+            "description": "desc",
+            "status": "active",
+            "source_connection_id": 1,
+            "destination_connection_id": 2,
+        },
+    ),
+    (
+        TransformationItem,
+        {
+            "id": 3,
+            "name": "orders",
+            "description": "all orders",
+            "materialization": "table",
+            "schema_name": "marts",
+        },
+    ),
+    (
+        ScheduleItem,
+        {
+            "id": 7,
+            "target_type": "upload",
+            "target_id": 1,
+            "cron_expression": "0 * * * *",
+            "timezone": "UTC",
+            "is_active": True,
+        },
+    ),
+    (
+        RunItem,
+        {
+            "id": 10,
+            "target_type": "upload",
+            "target_id": 2,
+            "status": "success",
+            "started_at": "2024-01-01",
+            "finished_at": "2024-01-01",
+            "rows_loaded": 100,
+            "error_message": "",
+        },
+    ),
+]
+
+_DEFAULT_CASES = [
+    (ConnectionItem, {"id": 0, "name": "", "connection_type": ""}),
+    (UploadItem, {"id": 0, "description": "", "status": ""}),
+    (TransformationItem, {"id": 0, "schema_name": ""}),
+    (ScheduleItem, {"id": 0, "is_active": True}),
+    (RunItem, {"id": 0, "status": "", "rows_loaded": 0, "error_message": ""}),
+]
+
+
+class TestItemModels:
+    @pytest.mark.parametrize(
+        "item_cls,kwargs", _ITEM_CASES, ids=[cls.__name__ for cls, _ in _ITEM_CASES]
+    )
+    def test_create_with_fields(self, item_cls, kwargs):
+        item = item_cls(**kwargs)
+        for name, value in kwargs.items():
+            assert getattr(item, name) == value, name
+
+    @pytest.mark.parametrize(
+        "item_cls,expected", _DEFAULT_CASES, ids=[cls.__name__ for cls, _ in _DEFAULT_CASES]
+    )
+    def test_defaults(self, item_cls, expected):
+        item = item_cls()
+        for name, value in expected.items():
+            assert getattr(item, name) == value, name
+
+    def test_is_frozen(self):
+        item = ConnectionItem(id=1, name="My DB")
+        with pytest.raises(ValidationError):
+            item.name = "Other"
+        assert item.model_copy(update={"test_status": "ok"}).test_status == "ok"
+
+
+_DIRECTION_CASES = [
+    *((t, ConnectionDirection.BOTH) for t in ("postgres", "mysql", "mssql", "sqlite")),
+    *((t, ConnectionDirection.SOURCE) for t in ("csv", "json", "parquet", "s3", "rest_api")),
+    *((t, ConnectionDirection.DESTINATION) for t in ("bigquery", "snowflake", "redshift")),
+    ("unknown", ConnectionDirection.SOURCE),
+]
 
 
 class TestInferDirection:
-    def test_both_for_database_types(self):
-        for t in ("postgres", "mysql", "mssql", "sqlite"):
-            assert _infer_direction(t) == ConnectionDirection.BOTH
-
-    def test_source_only_for_file_and_rest(self):
-        for t in ("csv", "json", "parquet", "s3", "rest_api"):
-            assert _infer_direction(t) == ConnectionDirection.SOURCE
-
-    def test_destination_only_for_cloud_warehouses(self):
-        for t in ("bigquery", "snowflake", "redshift"):
-            assert _infer_direction(t) == ConnectionDirection.DESTINATION
-
-
-class TestUploadItem:
-    def test_create_with_fields(self):
-        item = UploadItem(
-            id=5,
-            name="ETL",
-            description="desc",
-            status="active",
-            source_connection_id=1,
-            destination_connection_id=2,
-        )
-        assert item.id == 5
-        assert item.name == "ETL"
-        assert item.status == "active"
-        assert item.source_connection_id == 1
-        assert item.destination_connection_id == 2
-
-    def test_defaults(self):
-        item = UploadItem()
-        assert item.id == 0
-        assert item.description == ""
-        assert item.status == ""
-
-
-class TestTransformationItem:
-    def test_create_with_fields(self):
-        item = TransformationItem(
-            id=3,
-            name="orders",
-            description="all orders",
-            materialization="table",
-            schema_name="marts",
-        )
-        assert item.id == 3
-        assert item.name == "orders"
-        assert item.materialization == "table"
-        assert item.schema_name == "marts"
-
-    def test_defaults(self):
-        item = TransformationItem()
-        assert item.id == 0
-        assert item.schema_name == ""
-
-
-class TestScheduleItem:
-    def test_create_with_fields(self):
-        item = ScheduleItem(
-            id=7,
-            target_type="upload",
-            target_id=1,
-            cron_expression="0 * * * *",
-            timezone="UTC",
-            is_active=True,
-        )
-        assert item.id == 7
-        assert item.target_type == "upload"
-        assert item.cron_expression == "0 * * * *"
-        assert item.is_active is True
-
-    def test_defaults(self):
-        item = ScheduleItem()
-        assert item.id == 0
-        assert item.is_active is True
+    @pytest.mark.parametrize(
+        "connection_type,expected",
+        _DIRECTION_CASES,
+        ids=[t for t, _ in _DIRECTION_CASES],
+    )
+    def test_infer_direction(self, connection_type, expected):
+        assert _infer_direction(connection_type) == expected
+
+
+# Form-field defaults for the ConnectionState stand-in used by _build_config tests;
+# read-only so no test can leak a changed default into the shared prototype
+_DEFAULT_FORM_FIELDS = types.MappingProxyType(
+    {
+        "form_type": "postgres",
+        "form_host": "",
+        "form_port": "",
+        "form_user": "",
+        "form_password": "",
+        "form_database": "",
+        "form_schema": "",
+        "form_path": "",
+        "form_project": "",
+        "form_dataset": "",
+        "form_keyfile_json": "",
+        "form_account": "",
+        "form_warehouse": "",
+        "form_role": "",
+        "form_bucket_url": "",
+        "form_aws_access_key_id": "",
+        "form_aws_secret_access_key": "",
+        "form_region_name": "",
+        "form_endpoint_url": "",
+        "form_base_url": "",
+        "form_api_key": "",
+        "form_extra_headers": "",
+        "form_uploaded_file_id": 0,
+        "form_uploaded_file_name": "",
+        "form_spreadsheet_url": "",
+        "form_service_account_json": "",
+        "form_use_raw_json": False,
+        "form_config": "{}",
+    }
+)
+
+
+class _FakeConnState:
+    """Slotted attribute holder standing in for ConnectionState in _build_config tests."""
+
+    __slots__ = (*_DEFAULT_FORM_FIELDS, "_build_config")
+
+
+# Resolved once: the real handler bodies exercised against the stand-in
+_BUILD_CONFIG = ConnectionState._build_config
+_SET_FORM_TYPE_FN = ConnectionState.set_form_type.fn
+
+_PROTOTYPE_STATE = _FakeConnState()
+for _name, _value in _DEFAULT_FORM_FIELDS.items():
+    setattr(_PROTOTYPE_STATE, _name, _value)
 
 
 class TestConnectionBuildConfig:
     """Tests for ConnectionState._build_config()."""
 
     def _make_state(self, **overrides):
-        """Create a ConnectionState-like object with form fields for _build_config."""
-        from datanika.ui.state.connection_state import ConnectionState
-
-        defaults = {
-            "form_type": "postgres",
-            "form_host": "",
-            "form_port": "",
-            "form_user": "",
-            "form_password": "",
-            "form_database": "",
-            "form_schema": "",
-            "form_path": "",
-            "form_project": "",
-            "form_dataset": "",
-            "form_keyfile_json": "",
-            "form_account": "",
-            "form_warehouse": "",
-            "form_role": "",
-            "form_bucket_url": "",
-            "form_aws_access_key_id": "",
-            "form_aws_secret_access_key": "",
-            "form_region_name": "",
-            "form_endpoint_url": "",
-            "form_base_url": "",
-            "form_api_key": "",
-            "form_extra_headers": "",
-            "form_uploaded_file_id": 0,
-            "form_uploaded_file_name": "",
-            "form_spreadsheet_url": "",
-            "form_service_account_json": "",
-            "form_use_raw_json": False,
-            "form_config": "{}",
-        }
-        defaults.update(overrides)
-
-        class FakeState:
-            pass
-
-        obj = FakeState()
-        for k, v in defaults.items():
+        """Clone the prototype state, apply overrides and bind the real _build_config."""
+        obj = copy.copy(_PROTOTYPE_STATE)
+        for k, v in overrides.items():
             setattr(obj, k, v)
         # Bind the real _build_config method
-        import types
-
-        obj._build_config = types.MethodType(ConnectionState._build_config, obj)
+        obj._build_config = functools.partial(_BUILD_CONFIG, obj)
         return obj
 
     def test_build_config_postgres(self):
@@ -304,6 +330,26 @@ class TestConnectionBuildConfig:
         config = state._build_config()
         assert config == {"bucket_url": "/data/parquet"}
 
+    def test_build_config_csv_uploaded_file(self):
+        state = self._make_state(form_type="csv", form_uploaded_file_id=7)
+        config = state._build_config()
+        assert config == {"uploaded_file_id": 7}
+
+    def test_build_config_mongodb_ignores_schema(self):
+        state = self._make_state(
+            form_type="mongodb",
+            form_host="mongo.local",
+            form_port="27017",
+            form_database="app",
+            form_schema="ignored",
+        )
+        config = state._build_config()
+        assert config == {"host": "mongo.local", "port": 27017, "database": "app"}
+
+    def test_build_config_unknown_type_is_empty(self):
+        state = self._make_state(form_type="unknown", form_host="h")
+        assert state._build_config() == {}
+
     def test_build_config_rest_api(self):
         state = self._make_state(
             form_type="rest_api",
@@ -328,10 +374,7 @@ class TestConnectionBuildConfig:
 
     def _call_set_form_type(self, state, value):
         """Call the underlying set_form_type function, bypassing Reflex EventHandler."""
-        from datanika.ui.state.connection_state import ConnectionState
-
-        fn = ConnectionState.set_form_type.fn
-        fn(state, value)
+        _SET_FORM_TYPE_FN(state, value)
 
     def test_port_default_postgres(self):
         state = self._make_state(form_type="mysql", form_port="3306")
@@ -380,27 +423,3 @@ class TestConnectionBuildConfig:
         )
         config = state._build_config()
         assert "schema" not in config
-
-
-class TestRunItem:
-    def test_create_with_fields(self):
-        item = RunItem(
-            id=10,
-            target_type="upload",
-            target_id=2,
-            status="success",
-            started_at="2024-01-01",
-            finished_at="2024-01-01",
-            rows_loaded=100,
-            error_message="",
-        )
-        assert item.id == 10
-        assert item.status == "success"
-        assert item.rows_loaded == 100
-
-    def test_defaults(self):
-        item = RunItem()
-        assert item.id == 0
-        assert item.status == ""
-        assert item.rows_loaded == 0
-        assert item.error_message == ""
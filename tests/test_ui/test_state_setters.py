@@ -2,286 +2,152 @@
 
 import inspect
 
+import pytest
+
+from datanika.ui.state.auth_state import AuthState
+from datanika.ui.state.connection_state import ConnectionState, _validate_connection_form
+from datanika.ui.state.dag_state import DagState
+from datanika.ui.state.run_state import RunState
+from datanika.ui.state.schedule_state import ScheduleState
+from datanika.ui.state.settings_state import SettingsState
+from datanika.ui.state.transformation_state import TransformationState
+from datanika.ui.state.upload_state import UploadState
+
+
+def _assert_members(cls, expected):
+    """Check every expected name in one pass over the MRO, reporting all that are missing."""
+    available = set().union(*(vars(klass) for klass in inspect.getmro(cls)))
+    missing = [name for name in expected if name not in available]
+    assert not missing, f"{cls.__name__} missing: {missing}"
+    assert all(callable(getattr(cls, name)) for name in expected)
+
 
 class TestAuthStateSetters:
     def test_clear_auth_error_exists(self):
-        from datanika.ui.state.auth_state import AuthState
-
         method = getattr(AuthState, "clear_auth_error", None)
         assert method is not None, "AuthState missing clear_auth_error"
         assert callable(method)
 
-    def test_form_handlers_accept_form_data(self):
-        from datanika.ui.state.auth_state import AuthState
-
+    def test_form_handlers_accept_form_data(self, handler_info):
         for name in ["login", "signup"]:
-            handler = getattr(AuthState, name)
-            fn = handler.fn if hasattr(handler, "fn") else handler
-            sig = inspect.signature(fn)
-            params = list(sig.parameters.keys())
+            params = handler_info(AuthState, name).signature.parameters
             assert "form_data" in params, f"AuthState.{name} should accept form_data"
 
 
+def _form(conn_type, **fields):
+    """Keyword arguments for _validate_connection_form with a valid name and structured mode."""
+    return {"name": "X", "conn_type": conn_type, "use_raw_json": False, **fields}
+
+
+_DB = {"host": "localhost", "port": "5432", "database": "db"}
+_SNOWFLAKE = {"account": "acct", "user": "u", "database": "db"}
+
+# (id, kwargs, expected) — expected is a substring of the error, or "" for a valid form
+_FORM_CASES = [
+    # Connection name always required
+    ("empty_name", _form("postgres", name=""), "name is required"),
+    ("whitespace_name", _form("postgres", name="   "), "name is required"),
+    # Raw JSON skips type-specific checks
+    ("raw_json_skips_field_checks", _form("postgres", name="My Conn", use_raw_json=True), ""),
+    # DB types (postgres, mysql, mssql, redshift)
+    *(
+        (f"{t}_missing_host", _form(t, **{**_DB, "host": ""}), "Host is required")
+        for t in ("postgres", "mysql", "mssql", "redshift")
+    ),
+    ("db_missing_port", _form("postgres", **{**_DB, "port": ""}), "Port is required"),
+    (
+        "db_missing_database",
+        _form("mysql", **{**_DB, "port": "3306", "database": ""}),
+        "Database is required",
+    ),
+    ("db_valid", _form("postgres", **{**_DB, "database": "mydb"}), ""),
+    # SQLite
+    ("sqlite_missing_path", _form("sqlite", path=""), "path is required"),
+    ("sqlite_valid", _form("sqlite", path="/data/my.db"), ""),
+    # BigQuery
+    (
+        "bigquery_missing_project",
+        _form("bigquery", project="", dataset="raw"),
+        "Project ID is required",
+    ),
+    (
+        "bigquery_missing_dataset",
+        _form("bigquery", project="proj", dataset=""),
+        "Dataset is required",
+    ),
+    ("bigquery_valid", _form("bigquery", project="proj", dataset="raw"), ""),
+    # Snowflake
+    (
+        "snowflake_missing_account",
+        _form("snowflake", **{**_SNOWFLAKE, "account": ""}),
+        "Account is required",
+    ),
+    (
+        "snowflake_missing_user",
+        _form("snowflake", **{**_SNOWFLAKE, "user": ""}),
+        "User is required",
+    ),
+    (
+        "snowflake_missing_database",
+        _form("snowflake", **{**_SNOWFLAKE, "database": ""}),
+        "Database is required",
+    ),
+    ("snowflake_valid", _form("snowflake", **_SNOWFLAKE), ""),
+    # S3
+    ("s3_missing_bucket_url", _form("s3", bucket_url=""), "Bucket URL is required"),
+    ("s3_valid", _form("s3", bucket_url="s3://my-bucket"), ""),
+    # File types (csv, json, parquet)
+    *(
+        (f"{t}_missing_path", _form(t, bucket_url=""), "path is required")
+        for t in ("csv", "json", "parquet")
+    ),
+    ("file_type_valid", _form("csv", bucket_url="/data/files"), ""),
+    # REST API
+    ("rest_api_missing_base_url", _form("rest_api", base_url=""), "Base URL is required"),
+    ("rest_api_valid", _form("rest_api", base_url="https://api.example.com"), ""),
+]
+
+
 class TestConnectionFormValidation:
     """Tests for _validate_connection_form required-field checks."""
 
-    def _validate(self, **kwargs):
-        from datanika.ui.state.connection_state import _validate_connection_form
-
-        return _validate_connection_form(**kwargs)
-
-    # -- Connection name always required --
-
-    def test_empty_name_rejected(self):
-        err = self._validate(name="", conn_type="postgres", use_raw_json=False)
-        assert "name is required" in err.lower()
-
-    def test_whitespace_name_rejected(self):
-        err = self._validate(name="   ", conn_type="postgres", use_raw_json=False)
-        assert "name is required" in err.lower()
-
-    # -- Raw JSON skips type-specific checks --
-
-    def test_raw_json_skips_field_checks(self):
-        err = self._validate(name="My Conn", conn_type="postgres", use_raw_json=True)
-        assert err == ""
-
-    # -- DB types (postgres, mysql, mssql, redshift) --
-
-    def test_db_missing_host(self):
-        for t in ("postgres", "mysql", "mssql", "redshift"):
-            err = self._validate(
-                name="X",
-                conn_type=t,
-                use_raw_json=False,
-                host="",
-                port="5432",
-                database="db",
-            )
-            assert "Host is required" in err, f"Failed for {t}"
-
-    def test_db_missing_port(self):
-        err = self._validate(
-            name="X",
-            conn_type="postgres",
-            use_raw_json=False,
-            host="localhost",
-            port="",
-            database="db",
-        )
-        assert "Port is required" in err
-
-    def test_db_missing_database(self):
-        err = self._validate(
-            name="X",
-            conn_type="mysql",
-            use_raw_json=False,
-            host="localhost",
-            port="3306",
-            database="",
-        )
-        assert "Database is required" in err
-
-    def test_db_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="postgres",
-            use_raw_json=False,
-            host="localhost",
-            port="5432",
-            database="mydb",
-        )
-        assert err == ""
-
-    # -- SQLite --
-
-    def test_sqlite_missing_path(self):
-        err = self._validate(
-            name="X",
-            conn_type="sqlite",
-            use_raw_json=False,
-            path="",
-        )
-        assert "path is required" in err.lower()
-
-    def test_sqlite_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="sqlite",
-            use_raw_json=False,
-            path="/data/my.db",
-        )
-        assert err == ""
-
-    # -- BigQuery --
-
-    def test_bigquery_missing_project(self):
-        err = self._validate(
-            name="X",
-            conn_type="bigquery",
-            use_raw_json=False,
-            project="",
-            dataset="raw",
-        )
-        assert "Project ID is required" in err
-
-    def test_bigquery_missing_dataset(self):
-        err = self._validate(
-            name="X",
-            conn_type="bigquery",
-            use_raw_json=False,
-            project="proj",
-            dataset="",
-        )
-        assert "Dataset is required" in err
-
-    def test_bigquery_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="bigquery",
-            use_raw_json=False,
-            project="proj",
-            dataset="raw",
-        )
-        assert err == ""
-
-    # -- Snowflake --
-
-    def test_snowflake_missing_account(self):
-        err = self._validate(
-            name="X",
-            conn_type="snowflake",
-            use_raw_json=False,
-            account="",
-            user="u",
-            database="db",
-        )
-        assert "Account is required" in err
-
-    def test_snowflake_missing_user(self):
-        err = self._validate(
-            name="X",
-            conn_type="snowflake",
-            use_raw_json=False,
-            account="acct",
-            user="",
-            database="db",
-        )
-        assert "User is required" in err
-
-    def test_snowflake_missing_database(self):
-        err = self._validate(
-            name="X",
-            conn_type="snowflake",
-            use_raw_json=False,
-            account="acct",
-            user="u",
-            database="",
-        )
-        assert "Database is required" in err
-
-    def test_snowflake_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="snowflake",
-            use_raw_json=False,
-            account="acct",
-            user="u",
-            database="db",
-        )
-        assert err == ""
-
-    # -- S3 --
-
-    def test_s3_missing_bucket_url(self):
-        err = self._validate(
-            name="X",
-            conn_type="s3",
-            use_raw_json=False,
-            bucket_url="",
-        )
-        assert "Bucket URL is required" in err
-
-    def test_s3_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="s3",
-            use_raw_json=False,
-            bucket_url="s3://my-bucket",
-        )
-        assert err == ""
-
-    # -- File types (csv, json, parquet) --
-
-    def test_file_type_missing_path(self):
-        for t in ("csv", "json", "parquet"):
-            err = self._validate(
-                name="X",
-                conn_type=t,
-                use_raw_json=False,
-                bucket_url="",
-            )
-            assert "path is required" in err.lower(), f"Failed for {t}"
-
-    def test_file_type_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="csv",
-            use_raw_json=False,
-            bucket_url="/data/files",
-        )
-        assert err == ""
-
-    # -- REST API --
-
-    def test_rest_api_missing_base_url(self):
-        err = self._validate(
-            name="X",
-            conn_type="rest_api",
-            use_raw_json=False,
-            base_url="",
-        )
-        assert "Base URL is required" in err
-
-    def test_rest_api_valid(self):
-        err = self._validate(
-            name="X",
-            conn_type="rest_api",
-            use_raw_json=False,
-            base_url="https://api.example.com",
-        )
-        assert err == ""
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [case[1:] for case in _FORM_CASES],
+        ids=[case[0] for case in _FORM_CASES],
+    )
+    def test_validate(self, kwargs, expected):
+        err = _validate_connection_form(**kwargs)
+        if expected:
+            assert expected in err
+        else:
+            assert err == ""
 
 
-class TestConnectionStateTestMethods:
-    def test_test_connection_from_form_exists(self):
-        from datanika.ui.state.connection_state import ConnectionState
+@pytest.fixture(scope="module")
+def cstate_fields():
+    """ConnectionState field names, materialized once per module."""
+    return frozenset(ConnectionState.get_fields())
 
-        method = getattr(ConnectionState, "test_connection_from_form", None)
-        assert method is not None, "ConnectionState missing test_connection_from_form"
-        fn = method.fn if hasattr(method, "fn") else method
-        assert inspect.iscoroutinefunction(fn)
 
-    def test_test_saved_connection_exists(self):
-        from datanika.ui.state.connection_state import ConnectionState
-
-        method = getattr(ConnectionState, "test_saved_connection", None)
-        assert method is not None, "ConnectionState missing test_saved_connection"
-        fn = method.fn if hasattr(method, "fn") else method
-        assert inspect.iscoroutinefunction(fn)
+class TestConnectionStateTestMethods:
+    def test_test_connection_from_form_exists(self, handler_info):
+        info = handler_info(ConnectionState, "test_connection_from_form")
+        assert info.handler is not None, "ConnectionState missing test_connection_from_form"
+        assert info.is_coroutine
 
-    def test_test_state_vars_exist(self):
-        from datanika.ui.state.connection_state import ConnectionState
+    def test_test_saved_connection_exists(self, handler_info):
+        info = handler_info(ConnectionState, "test_saved_connection")
+        assert info.handler is not None, "ConnectionState missing test_saved_connection"
+        assert info.is_coroutine
 
-        fields = ConnectionState.get_fields()
-        assert "test_message" in fields, "ConnectionState missing test_message"
-        assert "test_success" in fields, "ConnectionState missing test_success"
+    def test_test_state_vars_exist(self, cstate_fields):
+        assert "test_message" in cstate_fields, "ConnectionState missing test_message"
+        assert "test_success" in cstate_fields, "ConnectionState missing test_success"
 
 
 class TestConnectionStateSetters:
     def test_all_setters_exist(self):
-        from datanika.ui.state.connection_state import ConnectionState
-
         expected = [
             "set_form_name",
             "set_form_type",
@@ -309,26 +175,16 @@ class TestConnectionStateSetters:
             "set_form_extra_headers",
             "set_form_use_raw_json",
         ]
-        for name in expected:
-            method = getattr(ConnectionState, name, None)
-            assert method is not None, f"ConnectionState missing {name}"
-            assert callable(method)
-
-    def test_bool_setter_signature(self):
-        from datanika.ui.state.connection_state import ConnectionState
-
-        handler = ConnectionState.set_form_use_raw_json
-        fn = handler.fn if hasattr(handler, "fn") else handler
-        sig = inspect.signature(fn)
-        params = sig.parameters
+        _assert_members(ConnectionState, expected)
+
+    def test_bool_setter_signature(self, handler_info):
+        params = handler_info(ConnectionState, "set_form_use_raw_json").signature.parameters
         assert "value" in params
         assert params["value"].annotation is bool
 
 
 class TestUploadStateSetters:
     def test_all_setters_exist(self):
-        from datanika.ui.state.upload_state import UploadState
-
         expected = [
             "set_form_name",
             "set_form_description",
@@ -351,27 +207,17 @@ class TestUploadStateSetters:
             "set_form_config",
             "set_form_use_raw_json",
         ]
-        for name in expected:
-            method = getattr(UploadState, name, None)
-            assert method is not None, f"UploadState missing {name}"
-            assert callable(method)
-
-    def test_bool_setter_signatures(self):
-        from datanika.ui.state.upload_state import UploadState
+        _assert_members(UploadState, expected)
 
+    def test_bool_setter_signatures(self, handler_info):
         for name in ["set_form_enable_incremental", "set_form_use_raw_json"]:
-            handler = getattr(UploadState, name)
-            fn = handler.fn if hasattr(handler, "fn") else handler
-            sig = inspect.signature(fn)
-            params = sig.parameters
+            params = handler_info(UploadState, name).signature.parameters
             assert "value" in params
             assert params["value"].annotation is bool
 
 
 class TestTransformationStateSetters:
     def test_all_setters_exist(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
         expected = [
             "set_form_name",
             "set_form_sql_body",
@@ -383,77 +229,50 @@ class TestTransformationStateSetters:
             "set_form_updated_at",
             "set_form_on_schema_change",
         ]
-        for name in expected:
-            method = getattr(TransformationState, name, None)
-            assert method is not None, f"TransformationState missing {name}"
-            assert callable(method)
+        _assert_members(TransformationState, expected)
 
 
 class TestScheduleStateSetters:
     def test_all_setters_exist(self):
-        from datanika.ui.state.schedule_state import ScheduleState
-
         expected = [
             "set_form_target_type",
             "set_form_target_name",
             "set_form_cron",
             "set_form_timezone",
         ]
-        for name in expected:
-            method = getattr(ScheduleState, name, None)
-            assert method is not None, f"ScheduleState missing {name}"
-            assert callable(method)
+        _assert_members(ScheduleState, expected)
 
 
 class TestDagStateSetters:
     def test_all_setters_exist(self):
-        from datanika.ui.state.dag_state import DagState
-
         expected = [
             "set_form_upstream_type",
             "set_form_upstream_name",
             "set_form_downstream_type",
             "set_form_downstream_name",
         ]
-        for name in expected:
-            method = getattr(DagState, name, None)
-            assert method is not None, f"DagState missing {name}"
-            assert callable(method)
+        _assert_members(DagState, expected)
 
 
 class TestSettingsStateSetters:
     def test_all_setters_exist(self):
-        from datanika.ui.state.settings_state import SettingsState
-
         expected = [
             "set_edit_org_name",
             "set_edit_org_slug",
             "set_invite_email",
             "set_invite_role",
         ]
-        for name in expected:
-            method = getattr(SettingsState, name, None)
-            assert method is not None, f"SettingsState missing {name}"
-            assert callable(method)
+        _assert_members(SettingsState, expected)
 
 
 class TestRunStateSetters:
     def test_filter_setters_exist(self):
-        from datanika.ui.state.run_state import RunState
-
         expected = [
             "set_filter",
             "set_target_type_filter",
         ]
-        for name in expected:
-            method = getattr(RunState, name, None)
-            assert method is not None, f"RunState missing {name}"
-            assert callable(method)
-
-    def test_filter_setters_are_async(self):
-        from datanika.ui.state.run_state import RunState
+        _assert_members(RunState, expected)
 
+    def test_filter_setters_are_async(self, handler_info):
         for name in ["set_filter", "set_target_type_filter"]:
-            handler = getattr(RunState, name)
-            fn = handler.fn if hasattr(handler, "fn") else handler
-            assert inspect.iscoroutinefunction(fn), f"RunState.{name} should be async"
+            assert handler_info(RunState, name).is_coroutine, f"RunState.{name} should be async"
@@ -1,115 +1,70 @@
 """Tests for SQL editor enhancements in TransformationState."""
 
-import inspect
+from types import SimpleNamespace
+
+import pytest
 
 
 class TestCanPreviewComputedVar:
     """Test can_preview computed var exists and returns correct values."""
 
-    def test_can_preview_exists(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        assert hasattr(TransformationState, "can_preview")
-
-    def test_can_preview_logic_all_filled(self):
-        """Directly test the can_preview logic: all fields filled → True."""
-        # can_preview checks: form_name, form_connection_option,
-        # form_materialization, form_schema_name
-        result = bool(
-            "my_model".strip()
-            and "1 — PG (postgres)".strip()
-            and "view".strip()
-            and "staging".strip()
-        )
-        assert result is True
-
-    def test_can_preview_logic_missing_name(self):
-        result = bool(
-            "".strip() and "1 — PG (postgres)".strip() and "view".strip() and "staging".strip()
-        )
-        assert result is False
-
-    def test_can_preview_logic_missing_connection(self):
-        result = bool("my_model".strip() and "".strip() and "view".strip() and "staging".strip())
-        assert result is False
-
-    def test_can_preview_logic_missing_materialization(self):
-        result = bool(
-            "my_model".strip() and "1 — PG (postgres)".strip() and "".strip() and "staging".strip()
+    def test_can_preview_exists(self, state_classes):
+        assert hasattr(state_classes.Transformation, "can_preview")
+
+    @pytest.mark.parametrize(
+        "name,connection,materialization,schema,expected",
+        [
+            ("my_model", "1 — PG (postgres)", "view", "staging", True),
+            ("", "1 — PG (postgres)", "view", "staging", False),
+            ("my_model", "", "view", "staging", False),
+            ("my_model", "1 — PG (postgres)", "", "staging", False),
+            ("my_model", "1 — PG (postgres)", "view", "", False),
+            ("  ", "1 — PG (postgres)", "view", "staging", False),
+        ],
+        ids=[
+            "all_filled",
+            "missing_name",
+            "missing_connection",
+            "missing_materialization",
+            "missing_schema",
+            "whitespace_only",
+        ],
+    )
+    def test_can_preview_logic(
+        self, state_classes, name, connection, materialization, schema, expected
+    ):
+        """Run the real can_preview getter against a stand-in carrying only the form fields."""
+        form = SimpleNamespace(
+            form_name=name,
+            form_connection_option=connection,
+            form_materialization=materialization,
+            form_schema_name=schema,
         )
-        assert result is False
-
-    def test_can_preview_logic_missing_schema(self):
-        result = bool(
-            "my_model".strip() and "1 — PG (postgres)".strip() and "view".strip() and "".strip()
-        )
-        assert result is False
-
-    def test_can_preview_logic_whitespace_only(self):
-        result = bool(
-            "  ".strip() and "1 — PG (postgres)".strip() and "view".strip() and "staging".strip()
-        )
-        assert result is False
-
-
-class TestHandleSqlFileUpload:
-    def test_method_exists(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        method = getattr(TransformationState, "handle_sql_file_upload", None)
-        assert method is not None, "TransformationState missing handle_sql_file_upload"
-
-    def test_method_is_async(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        handler = TransformationState.handle_sql_file_upload
-        fn = handler.fn if hasattr(handler, "fn") else handler
-        assert inspect.iscoroutinefunction(fn)
-
-
-class TestPreviewCompiledSqlFromForm:
-    def test_method_exists(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        method = getattr(TransformationState, "preview_compiled_sql_from_form", None)
-        assert method is not None
-
-    def test_method_is_async_generator(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        handler = TransformationState.preview_compiled_sql_from_form
-        fn = handler.fn if hasattr(handler, "fn") else handler
-        assert inspect.isasyncgenfunction(fn)
-
-
-class TestPreviewResultFromForm:
-    def test_method_exists(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        method = getattr(TransformationState, "preview_result_from_form", None)
-        assert method is not None
-
-    def test_method_is_async_generator(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        handler = TransformationState.preview_result_from_form
-        fn = handler.fn if hasattr(handler, "fn") else handler
-        assert inspect.isasyncgenfunction(fn)
-
-
-class TestSaveSqlAndReturn:
-    def test_method_exists(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        method = getattr(TransformationState, "save_sql_and_return", None)
-        assert method is not None
-
-    def test_method_is_sync(self):
-        from datanika.ui.state.transformation_state import TransformationState
-
-        handler = TransformationState.save_sql_and_return
-        fn = handler.fn if hasattr(handler, "fn") else handler
-        assert not inspect.iscoroutinefunction(fn)
+        can_preview = state_classes.Transformation.computed_vars["can_preview"].fget
+        assert can_preview(form) is expected
+
+
+_HANDLER_KINDS = {
+    "sync": lambda info: not info.is_coroutine and not info.is_asyncgen,
+    "coro": lambda info: info.is_coroutine,
+    "asyncgen": lambda info: info.is_asyncgen,
+}
+
+
+class TestSqlEditorHandlers:
+    @pytest.mark.parametrize(
+        "name,kind",
+        [
+            ("handle_sql_file_upload", "coro"),
+            ("preview_compiled_sql_from_form", "asyncgen"),
+            ("preview_result_from_form", "asyncgen"),
+            ("save_sql_and_return", "sync"),
+        ],
+    )
+    def test_handler_exists_with_kind(self, handler_info, state_classes, name, kind):
+        info = handler_info(state_classes.Transformation, name)
+        assert info.handler is not None, f"TransformationState missing {name}"
+        assert _HANDLER_KINDS[kind](info), f"TransformationState.{name} should be {kind}"
 
 
 class TestSqlEditorPageExists: